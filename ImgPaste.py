@@ -1,11 +1,12 @@
 import logging
 import sys
+import time
 import numpy as np
 from PyQt5 import QtWidgets, QtGui, QtCore
 from PyQt5.QtWidgets import QStyle
 from pynput import keyboard
 from paddleocr import PaddleOCR
-from PIL import ImageGrab, ImageDraw
+from PIL import Image, ImageGrab, ImageDraw
 from PyQt5.QtCore import QObject, QThread, pyqtSignal
 
 
@@ -58,14 +59,134 @@ class HotkeyHandler(QObject):
         if self.listener:
             self.listener.stop()
 
+def qimage_to_array(qimage):
+    """将QImage转换为RGB numpy数组（复制像素，不依赖QImage的生命周期）"""
+    qimage = qimage.convertToFormat(QtGui.QImage.Format_RGB888)
+    width, height = qimage.width(), qimage.height()
+    bytes_per_line = qimage.bytesPerLine()
+    ptr = qimage.constBits()
+    ptr.setsize(bytes_per_line * height)
+    # 每行可能有对齐填充，按行跨度取出有效像素
+    rows = np.frombuffer(ptr, dtype=np.uint8).reshape(height, bytes_per_line)
+    return rows[:, :width * 3].reshape(height, width, 3).copy()
+
+class ImageLoadSignals(QObject):
+    # 后台解码线程通过信号把结果送回主线程
+    thumbnail_ready = pyqtSignal(int, QtGui.QImage, QtCore.QSize)
+    image_ready = pyqtSignal(int, QtGui.QImage, QtGui.QImage)  # token, 原图, 显示用图
+    load_failed = pyqtSignal(int, str)
+
+class ImageLoadTask(QtCore.QRunnable):
+    """在线程池中解码剪贴板图片数据或图片文件，先发缩略图，再发原图和缩放到屏幕大小的显示图"""
+    THUMBNAIL_SIZE = 256  # 缩略图最长边
+
+    def __init__(self, token, source, signals, display_size):
+        super().__init__()
+        self.token = token
+        self.source = source  # 文件路径(str)、编码后的图片数据(QByteArray)或已解码的QImage
+        self.signals = signals
+        self.display_size = display_size  # 显示图的最大尺寸
+
+    def create_reader(self):
+        if isinstance(self.source, str):
+            reader = QtGui.QImageReader(self.source)
+        else:
+            # QBuffer必须在工作线程内创建
+            buffer = QtCore.QBuffer()
+            buffer.setData(self.source)
+            buffer.open(QtCore.QIODevice.ReadOnly)
+            reader = QtGui.QImageReader(buffer)
+            reader.buffer = buffer  # 保持buffer存活
+        reader.setAutoTransform(True)
+        return reader
+
+    def run(self):
+        try:
+            if isinstance(self.source, QtGui.QImage):
+                # 已解码的图片只需生成显示图
+                self.emit_image(self.source)
+                return
+
+            reader = self.create_reader()
+            size = reader.size()  # 只读取文件头，开销很小
+            if size.isValid() and max(size.width(), size.height()) > self.THUMBNAIL_SIZE:
+                thumb_size = size.scaled(self.THUMBNAIL_SIZE, self.THUMBNAIL_SIZE, QtCore.Qt.KeepAspectRatio)
+                # 解码器级别缩放（如JPEG），远快于先解码再缩放
+                reader.setScaledSize(thumb_size)
+                thumbnail = reader.read()
+                if not thumbnail.isNull():
+                    # 按EXIF方向旋转过的图片，原图尺寸也需要交换宽高
+                    if thumbnail.size() != thumb_size:
+                        size.transpose()
+                    self.signals.thumbnail_ready.emit(self.token, thumbnail, size)
+                # 每个reader只能读取一次，重新创建用于读取原图
+                reader = self.create_reader()
+
+            image = reader.read()
+            if image.isNull():
+                raise ValueError(f"图片解码失败: {reader.errorString()}")
+            self.emit_image(image)
+        except Exception as e:
+            logger.error(f"图片加载异常: {e}")
+            self.signals.load_failed.emit(self.token, str(e))
+
+    def emit_image(self, image):
+        # 大图在后台缩放到屏幕大小用于显示，原图只用于复制、保存和OCR
+        display = image
+        if image.width() > self.display_size.width() or image.height() > self.display_size.height():
+            display = image.scaled(self.display_size, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
+        self.signals.image_ready.emit(self.token, image, display)
+
+class ImageScaleSignals(QObject):
+    scaled_ready = pyqtSignal(int, QtGui.QImage)
+
+class ImageScaleTask(QtCore.QRunnable):
+    """在线程池中对图片做平滑缩放"""
+    def __init__(self, generation, image, size, signals):
+        super().__init__()
+        self.generation = generation
+        self.image = image
+        self.size = size
+        self.signals = signals
+
+    def run(self):
+        scaled = self.image.scaled(self.size, QtCore.Qt.IgnoreAspectRatio, QtCore.Qt.SmoothTransformation)
+        self.signals.scaled_ready.emit(self.generation, scaled)
+
 class FloatingImageWindow(QtWidgets.QWidget):
     BORDER = 3  # 边框宽度
-    def __init__(self, image, ocr_processor, parent=None):
+    SCREEN_FIT_RATIO = 0.9  # 大图初始显示时占屏幕可用区域的比例
+    SMOOTH_SCALE_DELAY = 150  # 缩放停止后多久在后台生成平滑图(ms)
+    MIN_SELECTION_SIZE = 5  # 区域OCR选区的最小边长(像素)，过小视为单击
+
+    def __init__(self, image, ocr_processor, parent=None, source_size=None, display_image=None, upright=False):
         super().__init__(parent)
         self.ocr_processor = ocr_processor
-        self.image = image
+        self.upright = upright  # 屏幕截图等已知为正向文字的内容，OCR时跳过方向分类
+        # 原图(QImage)只用于复制、保存和OCR；绘制使用分辨率不超过屏幕的显示图
+        self.image = image.toImage() if isinstance(image, QtGui.QPixmap) else image
+        self.display_image = display_image if display_image is not None else self.image
+        # 原图尺寸，缩放比例以原图为准；显示缩略图时与image尺寸不同
+        self.source_size = source_size if source_size is not None else self.image.size()
+        self.is_preview = source_size is not None and source_size != self.image.size()
+        self.scaled_cache = None  # 缓存缩放后的pixmap，避免每次重绘都缩放
+        self.scaled_target = None
+        # 缩放时先快速缩放显示，停止后在后台生成平滑版本
+        self.scale_generation = 0
+        self.scale_signals = ImageScaleSignals(self)
+        self.scale_signals.scaled_ready.connect(self.on_smooth_scaled)
+        self.smooth_timer = QtCore.QTimer(self)
+        self.smooth_timer.setSingleShot(True)
+        self.smooth_timer.setInterval(self.SMOOTH_SCALE_DELAY)
+        self.smooth_timer.timeout.connect(self.start_smooth_scale)
         self.scale = 1.0
         self.drag_pos = None
+        self.ocr_array = None  # 原图RGB数组缓存，区域OCR从中切片
+        self.ocr_result = None  # 整图OCR结果缓存(texts, polys)
+        # 区域选择模式
+        self.selecting = False
+        self.select_origin = None
+        self.rubber_band = QtWidgets.QRubberBand(QtWidgets.QRubberBand.Rectangle, self)
         self.setWindowFlags(
             QtCore.Qt.FramelessWindowHint |
             QtCore.Qt.WindowStaysOnTopHint |
@@ -75,9 +196,95 @@ class FloatingImageWindow(QtWidgets.QWidget):
         self.setAttribute(QtCore.Qt.WA_ShowWithoutActivating)
         self.setMouseTracking(True)
         # 初始化窗口尺寸比图片多出边框
-        self.resize(image.width() + self.BORDER * 2, image.height() + self.BORDER * 2)
+        self.resize(self.source_size.width() + self.BORDER * 2, self.source_size.height() + self.BORDER * 2)
         self.setCursor(QtCore.Qt.OpenHandCursor)
 
+    def set_image(self, image, display_image=None):
+        """替换显示的图片（缩略图加载完原图后调用），保持当前缩放比例"""
+        logger.debug(f"FloatingImageWindow.set_image: {image.width()}x{image.height()}")
+        self.image = image
+        self.display_image = display_image if display_image is not None else image
+        self.is_preview = False
+        self.scaled_cache = None
+        self.scaled_target = None
+        self.ocr_array = None
+        self.ocr_result = None
+        self.update()
+
+    def image_array(self):
+        """返回原图的RGB数组，首次调用时转换并缓存"""
+        if self.ocr_array is None:
+            self.ocr_array = qimage_to_array(self.image)
+        return self.ocr_array
+
+    @classmethod
+    def screen_fit_size(cls):
+        """鼠标所在屏幕上大图初始显示的最大尺寸"""
+        available = QtWidgets.QApplication.desktop().availableGeometry(QtGui.QCursor.pos())
+        return QtCore.QSize(
+            int(available.width() * cls.SCREEN_FIT_RATIO),
+            int(available.height() * cls.SCREEN_FIT_RATIO)
+        )
+
+    def fit_to_screen(self):
+        """原图超出屏幕可用区域时缩小初始比例"""
+        fit_size = self.screen_fit_size()
+        width, height = self.source_size.width(), self.source_size.height()
+        if width <= 0 or height <= 0:
+            return
+        fit = min(fit_size.width() / width, fit_size.height() / height, 1.0)
+        if fit < 1.0:
+            self.scale = max(fit, 0.2)
+            self.update_size()
+
+    def update_size(self):
+        # 缩放后窗口尺寸始终比图片多出边框
+        new_w = int(self.source_size.width() * self.scale) + self.BORDER * 2
+        new_h = int(self.source_size.height() * self.scale) + self.BORDER * 2
+        self.resize(new_w, new_h)
+        self.update()
+
+    def scaled_image(self):
+        """返回按当前比例缩放的pixmap，尺寸不变时复用缓存"""
+        target = QtCore.QSize(
+            max(1, int(self.source_size.width() * self.scale)),
+            max(1, int(self.source_size.height() * self.scale))
+        )
+        if self.scaled_cache is None or self.scaled_target != target:
+            self.scaled_target = target
+            if self.display_image.size() == target:
+                self.scaled_cache = QtGui.QPixmap.fromImage(self.display_image)
+            else:
+                # 先从显示图快速缩放，平滑版本稍后在后台生成
+                self.scaled_cache = QtGui.QPixmap.fromImage(self.display_image.scaled(
+                    target,
+                    QtCore.Qt.IgnoreAspectRatio,
+                    QtCore.Qt.FastTransformation
+                ))
+                self.smooth_timer.start()
+        return self.scaled_cache
+
+    def start_smooth_scale(self):
+        """在线程池中按当前尺寸生成平滑缩放图"""
+        if self.scaled_target is None:
+            return
+        source = self.display_image
+        # 放大超过显示图分辨率时从原图缩放
+        if (self.scaled_target.width() > source.width() and not self.is_preview
+                and self.image.width() > source.width()):
+            source = self.image
+        self.scale_generation += 1
+        QtCore.QThreadPool.globalInstance().start(
+            ImageScaleTask(self.scale_generation, source, self.scaled_target, self.scale_signals)
+        )
+
+    def on_smooth_scaled(self, generation, image):
+        # 忽略过期的缩放结果
+        if generation != self.scale_generation or image.size() != self.scaled_target:
+            return
+        self.scaled_cache = QtGui.QPixmap.fromImage(image)
+        self.update()
+
     def paintEvent(self, event):
         logger.debug("FloatingImageWindow.paintEvent触发")
         painter = QtGui.QPainter(self)
@@ -87,12 +294,7 @@ class FloatingImageWindow(QtWidgets.QWidget):
         painter.setPen(QtGui.QPen(QtGui.QColor(0, 120, 255), self.BORDER))
         painter.drawRect(rect.adjusted(1, 1, -2, -2))
         # Draw image (居中显示)
-        scaled_img = self.image.scaled(
-            int(self.image.width() * self.scale),
-            int(self.image.height() * self.scale),
-            QtCore.Qt.KeepAspectRatio,
-            QtCore.Qt.SmoothTransformation
-        )
+        scaled_img = self.scaled_image()
         # 图片居中，且留出边框
         x = (self.width() - scaled_img.width()) // 2
         y = (self.height() - scaled_img.height()) // 2
@@ -108,44 +310,113 @@ class FloatingImageWindow(QtWidgets.QWidget):
             self.scale = min(self.scale + 0.1, 5.0)
         else:
             self.scale = max(self.scale - 0.1, 0.2)
-        # 缩放后窗口尺寸始终比图片多出边框
-        new_w = int(self.image.width() * self.scale) + self.BORDER * 2
-        new_h = int(self.image.height() * self.scale) + self.BORDER * 2
-        self.resize(new_w, new_h)
-        self.update()
+        self.update_size()
     def mousePressEvent(self, event):
+        if self.selecting:
+            # 右键取消选择由contextMenuEvent处理
+            if event.button() == QtCore.Qt.LeftButton:
+                self.select_origin = event.pos()
+                self.rubber_band.setGeometry(QtCore.QRect(self.select_origin, QtCore.QSize()))
+                self.rubber_band.show()
+            return
         if event.button() == QtCore.Qt.LeftButton:
             self.drag_pos = event.globalPos() - self.frameGeometry().topLeft()
             self.setCursor(QtCore.Qt.ClosedHandCursor)
 
     def mouseMoveEvent(self, event):
+        if self.selecting:
+            if self.select_origin is not None:
+                self.rubber_band.setGeometry(QtCore.QRect(self.select_origin, event.pos()).normalized())
+            return
         if self.drag_pos and event.buttons() & QtCore.Qt.LeftButton:
             self.move(event.globalPos() - self.drag_pos)
 
     def mouseReleaseEvent(self, event):
         logger.debug("FloatingImageWindow.mouseReleaseEvent")
+        if self.selecting:
+            if event.button() == QtCore.Qt.LeftButton and self.select_origin is not None:
+                rect = QtCore.QRect(self.select_origin, event.pos()).normalized()
+                self.stop_region_select()
+                self.perform_region_ocr(rect)
+            return
         self.drag_pos = None
         self.setCursor(QtCore.Qt.OpenHandCursor)
 
+    def keyPressEvent(self, event):
+        if self.selecting and event.key() == QtCore.Qt.Key_Escape:
+            logger.info("取消区域选择")
+            self.stop_region_select()
+            return
+        super().keyPressEvent(event)
+
+    def start_region_select(self):
+        """进入区域选择模式，拖拽框选需要识别的区域"""
+        logger.info("进入区域选择模式")
+        self.selecting = True
+        self.select_origin = None
+        self.setCursor(QtCore.Qt.CrossCursor)
+        # 激活窗口以接收Esc取消
+        self.activateWindow()
+        self.setFocus()
+
+    def stop_region_select(self):
+        self.selecting = False
+        self.select_origin = None
+        self.rubber_band.hide()
+        self.setCursor(QtCore.Qt.OpenHandCursor)
+
+    def map_to_image(self, rect):
+        """将窗口坐标中的选区按当前缩放映射回原图像素坐标 (left, top, right, bottom)"""
+        scaled_img = self.scaled_image()
+        if scaled_img.width() <= 0 or scaled_img.height() <= 0:
+            return None
+        # 与paintEvent一致，图片居中显示
+        x = (self.width() - scaled_img.width()) // 2
+        y = (self.height() - scaled_img.height()) // 2
+        ratio_x = self.image.width() / scaled_img.width()
+        ratio_y = self.image.height() / scaled_img.height()
+        left = max(0, int((rect.left() - x) * ratio_x))
+        top = max(0, int((rect.top() - y) * ratio_y))
+        right = min(self.image.width(), int(np.ceil((rect.right() + 1 - x) * ratio_x)))
+        bottom = min(self.image.height(), int(np.ceil((rect.bottom() + 1 - y) * ratio_y)))
+        if right <= left or bottom <= top:
+            return None
+        return left, top, right, bottom
+
     def mouseDoubleClickEvent(self, event):
+        if self.selecting:
+            # 区域选择模式下双击只取消选择，不关闭窗口
+            logger.info("取消区域选择")
+            self.stop_region_select()
+            return
         logger.info("FloatingImageWindow.mouseDoubleClickEvent，窗口关闭")
         self.close()
 
     def contextMenuEvent(self, event):
         logger.info("FloatingImageWindow.contextMenuEvent")
+        if self.selecting:
+            # 区域选择模式下右键只取消选择，不弹出菜单
+            self.stop_region_select()
+            return
         menu = QtWidgets.QMenu(self)
         copy_action = menu.addAction("复制到剪切板")
         ocr_action = menu.addAction("OCR识别")
+        region_ocr_action = menu.addAction("区域OCR识别")
         save_action = menu.addAction("保存图片") 
         close_action = menu.addAction("关闭窗口")
+        # 原图尚未加载完成时，不对缩略图进行复制/保存/OCR
+        for preview_action in (copy_action, ocr_action, region_ocr_action, save_action):
+            preview_action.setEnabled(not self.is_preview)
         action = menu.exec_(event.globalPos())
         if action == copy_action:
             clipboard = QtWidgets.QApplication.clipboard()
-            clipboard.setPixmap(self.image)
+            clipboard.setImage(self.image)
         elif action == save_action:
             self.save_image()  # 执行保存图片
         elif action == ocr_action:
             self.perform_ocr()  # 执行OCR识别
+        elif action == region_ocr_action:
+            self.start_region_select()  # 框选区域后执行OCR识别
         elif action == close_action:
             self.close()
     def save_image(self):
@@ -161,8 +432,7 @@ class FloatingImageWindow(QtWidgets.QWidget):
             
             if file_path:
                 # 保存图片
-                qimage = self.image.toImage()
-                success = qimage.save(file_path)
+                success = self.image.save(file_path)
                 
                 if success:
                     logger.info(f"图片已保存到: {file_path}")
@@ -183,45 +453,79 @@ class FloatingImageWindow(QtWidgets.QWidget):
         logger.info("开始贴图OCR识别")
         
         try:
-            import tempfile
-            import os
-            from PIL import Image
-            
-            # 创建临时文件
-            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp_file:
-                tmp_filename = tmp_file.name
-            
-            try:
-                # 将QPixmap保存为临时文件
-                qimage = self.image.toImage()
-                qimage.save(tmp_filename, 'PNG')
-                
-                # 从临时文件加载PIL Image
-                pil_image = Image.open(tmp_filename)
-                
-                # 确保图像是RGB模式
-                if pil_image.mode != 'RGB':
-                    pil_image = pil_image.convert('RGB')
-                
-                # 调用OCR处理器处理图像
-                self.ocr_processor.image_ocr(pil_image)
-                
-            finally:
-                # 清理临时文件
-                if os.path.exists(tmp_filename):
-                    os.unlink(tmp_filename)
+            # 调用OCR处理器处理图像，缓存结果供区域OCR复用
+            result = self.ocr_processor.image_ocr(
+                self.image_array(),
+                upright=self.upright,
+                latency_budget_ms=self.ocr_processor.PINNED_LATENCY_BUDGET_MS
+            )
+            if result is not None:
+                self.ocr_result = result
             
         except Exception as e:
             logger.error(f"贴图OCR识别异常: {e}")
             import traceback
             logger.error(f"详细错误信息: {traceback.format_exc()}")
             QtWidgets.QMessageBox.critical(self, "OCR错误", str(e))
+
+    def perform_region_ocr(self, rect):
+        """对框选区域执行OCR识别，已有整图结果时直接筛选"""
+        region = None
+        if rect.width() >= self.MIN_SELECTION_SIZE and rect.height() >= self.MIN_SELECTION_SIZE:
+            region = self.map_to_image(rect)
+        if region is None:
+            logger.warning("选区无效")
+            return
+        left, top, right, bottom = region
+        logger.info(f"开始区域OCR识别: {region}")
+
+        try:
+            # 切片视图，不复制像素
+            crop = self.image_array()[top:bottom, left:right]
+            if self.ocr_result is not None:
+                logger.info("使用已缓存的整图OCR结果")
+                texts, polys = self.filter_ocr_result(region)
+                self.ocr_processor.show_result(crop, texts, polys)
+            else:
+                self.ocr_processor.image_ocr(
+                    crop,
+                    upright=self.upright,
+                    latency_budget_ms=self.ocr_processor.REGION_LATENCY_BUDGET_MS
+                )
+
+        except Exception as e:
+            logger.error(f"区域OCR识别异常: {e}")
+            import traceback
+            logger.error(f"详细错误信息: {traceback.format_exc()}")
+            QtWidgets.QMessageBox.critical(self, "OCR错误", str(e))
+
+    def filter_ocr_result(self, region):
+        """筛选中心点落在选区内的文本框，坐标转换为相对选区"""
+        left, top, right, bottom = region
+        texts, polys = self.ocr_result
+        region_texts = []
+        region_polys = []
+        for text, poly in zip(texts, polys):
+            points = np.asarray(poly, dtype=np.float32)
+            center_x, center_y = points.mean(axis=0)
+            if left <= center_x < right and top <= center_y < bottom:
+                region_texts.append(text)
+                region_polys.append(points - (left, top))
+        return region_texts, region_polys
    
 
 class TrayIcon(QtWidgets.QSystemTrayIcon):
+    ocr_all_triggered = pyqtSignal()
+    ocr_selected_triggered = pyqtSignal()
+
     def __init__(self, icon, parent=None):
         super().__init__(icon, parent)
         menu = QtWidgets.QMenu(parent)
+        ocr_all_action = menu.addAction("OCR识别所有贴图")
+        ocr_all_action.triggered.connect(self.ocr_all_triggered.emit)
+        ocr_selected_action = menu.addAction("选择贴图OCR识别...")
+        ocr_selected_action.triggered.connect(self.ocr_selected_triggered.emit)
+        menu.addSeparator()
         exit_action = menu.addAction("退出")
         exit_action.triggered.connect(QtWidgets.qApp.quit)
         self.setContextMenu(menu)
@@ -231,6 +535,15 @@ class ImgPasteApp(QtWidgets.QApplication):
         logger.info("ImgPasteApp初始化")
         super().__init__(argv)
         self.windows = []
+        # 后台图片加载线程池
+        self.load_pool = QtCore.QThreadPool(self)
+        self.load_signals = ImageLoadSignals()
+        self.load_signals.thumbnail_ready.connect(self.on_thumbnail_ready)
+        self.load_signals.image_ready.connect(self.on_image_ready)
+        self.load_signals.load_failed.connect(self.on_image_load_failed)
+        self.pending_windows = {}  # token -> 已显示缩略图、等待原图的窗口
+        self.pending_positions = {}  # token -> 窗口位置，None时由窗口管理器决定
+        self.next_load_token = 0
         self.tray = TrayIcon(QtGui.QIcon(), None)
         self.tray.setIcon(QtGui.QIcon(self.style().standardIcon(QStyle.SP_ComputerIcon)))
         self.tray.setVisible(True)
@@ -239,6 +552,8 @@ class ImgPasteApp(QtWidgets.QApplication):
         
         self.screenshot_ocr = ScreenshotOCR()
         logger.info("ScreenshotOCR初始化完成")
+        self.tray.ocr_all_triggered.connect(self.ocr_all_pinned)
+        self.tray.ocr_selected_triggered.connect(self.ocr_selected_pinned)
         
         # 创建并启动快捷键监听线程
         self.hotkey_thread = QThread()
@@ -293,7 +608,8 @@ class ImgPasteApp(QtWidgets.QApplication):
             pixmap = QtGui.QPixmap.fromImage(qimage)
             
             # 显示截图窗口
-            win = FloatingImageWindow(pixmap, self.screenshot_ocr)
+            # 截图为屏幕内容，文字总是正向的
+            win = FloatingImageWindow(pixmap, self.screenshot_ocr, upright=True)
             win.show()
             self.windows.append(win)
             logger.info("截图窗口已显示")
@@ -304,30 +620,146 @@ class ImgPasteApp(QtWidgets.QApplication):
             logger.error(f"详细错误信息: {traceback.format_exc()}")
             QtWidgets.QMessageBox.critical(None, "截图错误", str(e))
 
+    # 剪贴板中优先读取的编码图片格式，原始数据交给后台线程解码
+    CLIPBOARD_IMAGE_FORMATS = ('image/png', 'image/jpeg', 'image/bmp', 'image/gif', 'image/tiff', 'image/webp')
+    CASCADE_OFFSET = 30  # 多个贴图窗口的层叠偏移
+
     def paste_clipboard_image(self):
         try:
             logger.info("收到粘贴快捷键")
-            clipboard = QtWidgets.QApplication.clipboard()
-            if clipboard.mimeData().hasImage():
+            mime_data = QtWidgets.QApplication.clipboard().mimeData()
+            image_files = self.clipboard_image_files(mime_data)
+            if image_files:
+                logger.info(f"剪贴板有{len(image_files)}个图片文件")
+                # 多个文件从同一位置开始层叠显示
+                anchor = QtGui.QCursor.pos() if len(image_files) > 1 else None
+                for index, path in enumerate(image_files):
+                    position = None
+                    if anchor is not None:
+                        position = anchor + QtCore.QPoint(index * self.CASCADE_OFFSET, index * self.CASCADE_OFFSET)
+                    self.load_image_async(path, position)
+            elif mime_data.hasImage():
                 logger.info("剪贴板有图片")
-                image = clipboard.image()
-                pixmap = QtGui.QPixmap.fromImage(image)
-                logger.info("pixmap有图片")
-                win = FloatingImageWindow(pixmap, self.screenshot_ocr)
-                logger.info("win：%s", win)
-                try:
-                    win.show()
-                    logger.info("win.show")
-                except Exception as e:
-                    logger.error(f"显示图片窗口异常: {e}")
-                self.windows.append(win)
-                logger.info("图片窗口已显示")
+                for fmt in self.CLIPBOARD_IMAGE_FORMATS:
+                    if mime_data.hasFormat(fmt):
+                        logger.debug(f"剪贴板图片格式: {fmt}")
+                        self.load_image_async(QtCore.QByteArray(mime_data.data(fmt)))
+                        return
+                # 没有可用的编码数据时，只能在主线程取解码后的图片，缩放仍交给后台
+                self.load_image_async(QtWidgets.QApplication.clipboard().image())
             else:
                 logger.warning("剪贴板没有图片")
         except Exception as e:
             logger.error(f"贴图异常: {e}")
             QtWidgets.QMessageBox.critical(None, "贴图错误", str(e))
 
+    def clipboard_image_files(self, mime_data):
+        """从剪贴板的文件URL列表中筛选出可读取的本地图片文件"""
+        if not mime_data.hasUrls():
+            return []
+        supported = {bytes(fmt).decode().lower() for fmt in QtGui.QImageReader.supportedImageFormats()}
+        files = []
+        for url in mime_data.urls():
+            if not url.isLocalFile():
+                continue
+            path = url.toLocalFile()
+            if QtCore.QFileInfo(path).suffix().lower() in supported:
+                files.append(path)
+        return files
+
+    def load_image_async(self, source, position=None):
+        """把图片解码任务提交到线程池，多个文件并行加载"""
+        token = self.next_load_token
+        self.next_load_token += 1
+        self.pending_positions[token] = position
+        display_size = FloatingImageWindow.screen_fit_size()
+        self.load_pool.start(ImageLoadTask(token, source, self.load_signals, display_size))
+        logger.debug(f"图片加载任务已提交: token={token}")
+
+    def show_image_window(self, image, source_size=None, position=None, display_image=None):
+        win = FloatingImageWindow(image, self.screenshot_ocr, source_size=source_size, display_image=display_image)
+        win.fit_to_screen()
+        if position is not None:
+            win.move(position)
+        logger.info("win：%s", win)
+        try:
+            win.show()
+            logger.info("win.show")
+        except Exception as e:
+            logger.error(f"显示图片窗口异常: {e}")
+        self.windows.append(win)
+        logger.info("图片窗口已显示")
+        return win
+
+    def on_thumbnail_ready(self, token, thumbnail, source_size):
+        logger.debug(f"缩略图已加载: token={token}, 原图尺寸: {source_size.width()}x{source_size.height()}")
+        position = self.pending_positions.get(token)
+        self.pending_windows[token] = self.show_image_window(thumbnail, source_size, position)
+
+    def on_image_ready(self, token, image, display_image):
+        logger.debug(f"原图已加载: token={token}, 尺寸: {image.width()}x{image.height()}")
+        position = self.pending_positions.pop(token, None)
+        win = self.pending_windows.pop(token, None)
+        if win is not None:
+            win.set_image(image, display_image)
+        else:
+            # 小图不生成缩略图，直接显示
+            self.show_image_window(image, position=position, display_image=display_image)
+
+    def on_image_load_failed(self, token, message):
+        self.pending_positions.pop(token, None)
+        win = self.pending_windows.pop(token, None)
+        if win is not None:
+            win.close()
+        QtWidgets.QMessageBox.critical(None, "贴图错误", message)
+
+    def pinned_windows(self):
+        """当前显示中且原图已加载完成的贴图窗口，返回(标签, 窗口)列表"""
+        windows = [win for win in self.windows if win.isVisible() and not win.is_preview]
+        return [(f"贴图 {index + 1}", win) for index, win in enumerate(windows)]
+
+    def ocr_all_pinned(self):
+        logger.info("批量OCR所有贴图")
+        entries = self.pinned_windows()
+        if not entries:
+            QtWidgets.QMessageBox.information(None, "批量OCR", "当前没有贴图")
+            return
+        self.batch_ocr_windows(entries)
+
+    def ocr_selected_pinned(self):
+        logger.info("选择贴图进行批量OCR")
+        entries = self.pinned_windows()
+        if not entries:
+            QtWidgets.QMessageBox.information(None, "批量OCR", "当前没有贴图")
+            return
+        dlg = PinnedWindowPicker(entries)
+        if dlg.exec_() == QtWidgets.QDialog.Accepted:
+            selected = dlg.selected_windows()
+            if not selected:
+                QtWidgets.QMessageBox.information(None, "批量OCR", "未选择任何贴图")
+                return
+            self.batch_ocr_windows(selected)
+
+    def batch_ocr_windows(self, entries):
+        """将多个贴图合并为一次批量OCR，结果在同一个窗口中分页显示，标签与选择时一致"""
+        try:
+            arrays = [win.image_array() for _, win in entries]
+            upright = all(win.upright for _, win in entries)
+            results = self.screenshot_ocr.batch_ocr(arrays, upright=upright)
+            pages = []
+            for (label, win), img_array, result in zip(entries, arrays, results):
+                # 缓存结果供区域OCR复用
+                win.ocr_result = result
+                qimage, text = self.screenshot_ocr.render_result(img_array, *result)
+                pages.append((label, qimage, text))
+            dlg = OcrBatchResultDialog(pages)
+            dlg.exec_()
+        except Exception as e:
+            logger.error(f"批量OCR异常: {e}")
+            import traceback
+            logger.error(f"详细错误信息: {traceback.format_exc()}")
+            QtWidgets.QMessageBox.critical(None, "OCR错误", str(e))
+
 class ZoomableImageLabel(QtWidgets.QLabel):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -389,15 +821,12 @@ class ZoomableImageLabel(QtWidgets.QLabel):
             super().setPixmap(self.original_pixmap)
             self.update_parent_size()
 
-class OcrScreenshotDialog(QtWidgets.QDialog):
+class OcrResultWidget(QtWidgets.QWidget):
+    """OCR结果面板：左侧带识别框的图片，右侧识别文本"""
     def __init__(self, img, text, parent=None):
-        logger.info("OcrScreenshotDialog初始化")
         super().__init__(parent)
-        self.setWindowTitle("OCR识别结果")
-        self.setWindowFlags(QtCore.Qt.WindowStaysOnTopHint | QtCore.Qt.Tool)
-        self.resize(1000, 800)  # 调整窗口大小
-
         layout = QtWidgets.QHBoxLayout(self)  # 使用水平布局
+        layout.setContentsMargins(0, 0, 0, 0)
 
         # 左边：显示图片
         self.image_label = ZoomableImageLabel(self)
@@ -418,6 +847,22 @@ class OcrScreenshotDialog(QtWidgets.QDialog):
         self.text_edit.setPlainText(text)
         layout.addWidget(self.text_edit)
 
+class OcrScreenshotDialog(QtWidgets.QDialog):
+    def __init__(self, img, text, parent=None):
+        logger.info("OcrScreenshotDialog初始化")
+        super().__init__(parent)
+        self.setWindowTitle("OCR识别结果")
+        self.setWindowFlags(QtCore.Qt.WindowStaysOnTopHint | QtCore.Qt.Tool)
+        self.resize(1000, 800)  # 调整窗口大小
+
+        layout = QtWidgets.QHBoxLayout(self)  # 使用水平布局
+
+        # 左边图片、右边识别内容
+        self.result_widget = OcrResultWidget(img, text, self)
+        self.image_label = self.result_widget.image_label
+        self.text_edit = self.result_widget.text_edit
+        layout.addWidget(self.result_widget)
+
         # 复制按钮
         btn_copy = QtWidgets.QPushButton("复制到剪切板", self)
         btn_copy.clicked.connect(self.copy_text)
@@ -443,16 +888,335 @@ class OcrScreenshotDialog(QtWidgets.QDialog):
         """重置图片缩放"""
         self.image_label.reset_scale()
 
+class OcrBatchResultDialog(QtWidgets.QDialog):
+    """批量OCR结果窗口，每张贴图一个标签页，可合并导出全部文本"""
+    def __init__(self, pages, parent=None):
+        logger.info(f"OcrBatchResultDialog初始化，共{len(pages)}页")
+        super().__init__(parent)
+        self.setWindowTitle("批量OCR识别结果")
+        self.setWindowFlags(QtCore.Qt.WindowStaysOnTopHint | QtCore.Qt.Tool)
+        self.resize(1000, 800)  # 调整窗口大小
+
+        layout = QtWidgets.QHBoxLayout(self)
+
+        # 每张贴图一个标签页
+        self.tabs = QtWidgets.QTabWidget(self)
+        for title, img, text in pages:
+            self.tabs.addTab(OcrResultWidget(img, text, self.tabs), title)
+        layout.addWidget(self.tabs)
+
+        # 复制全部文本按钮
+        btn_copy = QtWidgets.QPushButton("复制全部文本", self)
+        btn_copy.clicked.connect(self.copy_text)
+
+        # 导出全部文本按钮
+        btn_export = QtWidgets.QPushButton("导出全部文本", self)
+        btn_export.clicked.connect(self.export_text)
+
+        # 重置当前页图片缩放按钮
+        btn_reset = QtWidgets.QPushButton("重置缩放", self)
+        btn_reset.clicked.connect(self.reset_image_scale)
+
+        # 创建按钮布局
+        button_layout = QtWidgets.QVBoxLayout()
+        button_layout.addWidget(btn_copy)
+        button_layout.addWidget(btn_export)
+        button_layout.addWidget(btn_reset)
+        button_layout.addStretch()
+
+        layout.addLayout(button_layout)
+
+    def combined_text(self):
+        """按标签页顺序合并所有识别文本"""
+        sections = []
+        for index in range(self.tabs.count()):
+            text = self.tabs.widget(index).text_edit.toPlainText()
+            sections.append(f"【{self.tabs.tabText(index)}】\n{text}")
+        return "\n\n".join(sections)
+
+    def copy_text(self):
+        logger.info("复制全部OCR文本到剪切板")
+        clipboard = QtWidgets.QApplication.clipboard()
+        clipboard.setText(self.combined_text())
+
+    def export_text(self):
+        """导出全部文本到文件"""
+        try:
+            file_path, _ = QtWidgets.QFileDialog.getSaveFileName(
+                self,
+                "导出文本",
+                "ocr_result.txt",  # 默认文件名
+                "Text (*.txt)"
+            )
+            if file_path:
+                with open(file_path, 'w', encoding='utf-8') as f:
+                    f.write(self.combined_text())
+                logger.info(f"OCR文本已导出到: {file_path}")
+        except Exception as e:
+            logger.error(f"导出文本异常: {e}")
+            QtWidgets.QMessageBox.critical(self, "导出失败", f"导出文本时发生错误:\n{str(e)}")
+
+    def reset_image_scale(self):
+        """重置当前页图片缩放"""
+        self.tabs.currentWidget().image_label.reset_scale()
+
+class PinnedWindowPicker(QtWidgets.QDialog):
+    """选择参与批量OCR的贴图窗口"""
+    THUMBNAIL_SIZE = 96
+
+    def __init__(self, entries, parent=None):
+        super().__init__(parent)
+        self.entries = entries  # (标签, 窗口)列表
+        self.setWindowTitle("选择贴图")
+        self.setWindowFlags(QtCore.Qt.WindowStaysOnTopHint | QtCore.Qt.Tool)
+
+        layout = QtWidgets.QVBoxLayout(self)
+        self.list_widget = QtWidgets.QListWidget(self)
+        self.list_widget.setIconSize(QtCore.QSize(self.THUMBNAIL_SIZE, self.THUMBNAIL_SIZE))
+        for label, win in entries:
+            icon = QtGui.QIcon(QtGui.QPixmap.fromImage(win.display_image.scaled(
+                self.THUMBNAIL_SIZE, self.THUMBNAIL_SIZE,
+                QtCore.Qt.KeepAspectRatio,
+                QtCore.Qt.SmoothTransformation
+            )))
+            item = QtWidgets.QListWidgetItem(icon, f"{label} ({win.image.width()}x{win.image.height()})")
+            item.setFlags(item.flags() | QtCore.Qt.ItemIsUserCheckable)
+            item.setCheckState(QtCore.Qt.Checked)
+            self.list_widget.addItem(item)
+        layout.addWidget(self.list_widget)
+
+        buttons = QtWidgets.QDialogButtonBox(
+            QtWidgets.QDialogButtonBox.Ok | QtWidgets.QDialogButtonBox.Cancel, self
+        )
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+
+    def selected_windows(self):
+        """返回勾选的(标签, 窗口)列表"""
+        return [
+            entry for index, entry in enumerate(self.entries)
+            if self.list_widget.item(index).checkState() == QtCore.Qt.Checked
+        ]
+
+class OcrEngineSelector:
+    """按图像尺寸、文字密度和耗时预算，在轻量(mobile)与完整(server)模型之间路由OCR请求"""
+    TIERS = {
+        'mobile': {
+            'text_detection_model_name': 'PP-OCRv5_mobile_det',
+            'text_recognition_model_name': 'PP-OCRv5_mobile_rec',
+        },
+        'server': {
+            'text_detection_model_name': 'PP-OCRv5_server_det',
+            'text_recognition_model_name': 'PP-OCRv5_server_rec',
+        },
+    }
+    # 初始耗时估计（毫秒/百万像素），运行后按实测值滑动更新
+    DEFAULT_MS_PER_MEGAPIXEL = {'mobile': 150.0, 'server': 800.0}
+    LATENCY_SMOOTHING = 0.3
+    SMALL_IMAGE_PIXELS = 400_000  # 小于该像素数视为小片段，始终使用mobile模型
+    MEDIUM_IMAGE_PIXELS = 2_000_000  # 中等尺寸图像仅在文字密集时使用server模型
+    DENSE_TEXT_RATIO = 0.12  # 边缘像素占比超过该值视为文字密集
+    EDGE_THRESHOLD = 40  # 相邻像素灰度差超过该值视为边缘
+    DENSITY_SAMPLE_SIZE = 256  # 估计文字密度时的采样边长
+    SINGLE_LINE_HEIGHT = 64  # 单行文字片段的最大高度
+    SINGLE_LINE_ASPECT = 3.0  # 单行文字片段的最小宽高比
+    # 文字方向分类和识别按批推理的批大小；PaddleOCR未提供检测阶段的批大小，检测仍逐张进行
+    BATCH_SIZE = 8
+    BATCH_SIZE_TOLERANCE = 1.25  # 批量识别时宽高均在该倍数内的图像填充为同一尺寸
+
+    def __init__(self):
+        self.engines = {}
+        self.metrics = {
+            tier: {
+                'loaded': False,
+                'load_ms': 0.0,
+                'calls': 0,
+                'total_ms': 0.0,
+                # 批量调用单独统计，不参与单次请求的耗时估计
+                'batch_calls': 0,
+                'batch_images': 0,
+                'batch_ms': 0.0,
+                'ms_per_megapixel': self.DEFAULT_MS_PER_MEGAPIXEL[tier],
+            }
+            for tier in self.TIERS
+        }
+
+    def get_engine(self, tier):
+        """按需加载指定档位的模型"""
+        if tier not in self.engines:
+            logger.info(f"加载OCR模型: {tier}")
+            start = time.perf_counter()
+            # 加载方向分类器，是否使用由每次请求决定
+            self.engines[tier] = PaddleOCR(
+                use_textline_orientation=True,
+                textline_orientation_batch_size=self.BATCH_SIZE,
+                text_recognition_batch_size=self.BATCH_SIZE,
+                **self.TIERS[tier]
+            )
+            load_ms = (time.perf_counter() - start) * 1000
+            self.metrics[tier]['loaded'] = True
+            self.metrics[tier]['load_ms'] = load_ms
+            logger.info(f"OCR模型{tier}加载完成，耗时{load_ms:.0f}ms")
+        return self.engines[tier]
+
+    def estimate_text_density(self, img_array):
+        """在降采样灰度图上统计水平边缘像素占比，粗略估计文字密度"""
+        height, width = img_array.shape[:2]
+        step = max(1, max(height, width) // self.DENSITY_SAMPLE_SIZE)
+        sample = img_array[::step, ::step]
+        gray = sample.mean(axis=2) if sample.ndim == 3 else sample.astype(np.float32)
+        diff = np.abs(np.diff(gray, axis=1))
+        if diff.size == 0:
+            return 0.0
+        return float((diff > self.EDGE_THRESHOLD).mean())
+
+    def estimate_latency(self, tier, pixels):
+        """估计识别耗时；模型加载是一次性开销，不计入单次请求的耗时预算"""
+        return self.metrics[tier]['ms_per_megapixel'] * pixels / 1_000_000
+
+    def is_single_line(self, img_array):
+        """单行横向文字片段"""
+        height, width = img_array.shape[:2]
+        return height <= self.SINGLE_LINE_HEIGHT and width >= height * self.SINGLE_LINE_ASPECT
+
+    def select(self, img_array, latency_budget_ms=None):
+        """
+        选择模型档位：小片段和单行文字始终用mobile；server预计超出耗时预算时用mobile；
+        中等尺寸图像仅在文字密集时用server，大图用server
+        """
+        height, width = img_array.shape[:2]
+        pixels = height * width
+        if pixels <= self.SMALL_IMAGE_PIXELS or self.is_single_line(img_array):
+            logger.debug(f"小片段({width}x{height})，使用mobile模型")
+            return 'mobile'
+        if latency_budget_ms is not None:
+            estimated = self.estimate_latency('server', pixels)
+            if estimated > latency_budget_ms:
+                logger.debug(f"server模型预计耗时{estimated:.0f}ms超出预算{latency_budget_ms}ms，使用mobile模型")
+                return 'mobile'
+        if pixels <= self.MEDIUM_IMAGE_PIXELS:
+            density = self.estimate_text_density(img_array)
+            if density < self.DENSE_TEXT_RATIO:
+                logger.debug(f"中等尺寸图像({width}x{height}, 文字密度{density:.3f})，使用mobile模型")
+                return 'mobile'
+        logger.debug(f"图像{width}x{height}，使用server模型")
+        return 'server'
+
+    def record(self, tier, elapsed_ms, pixels):
+        metrics = self.metrics[tier]
+        metrics['calls'] += 1
+        metrics['total_ms'] += elapsed_ms
+        if pixels > 0:
+            observed = elapsed_ms * 1_000_000 / pixels
+            metrics['ms_per_megapixel'] += self.LATENCY_SMOOTHING * (observed - metrics['ms_per_megapixel'])
+        logger.debug(f"OCR[{tier}]耗时{elapsed_ms:.0f}ms，累计{metrics['calls']}次/{metrics['total_ms']:.0f}ms")
+
+    def predict(self, img_array, latency_budget_ms=None, upright=False):
+        """
+        选择模型档位并执行OCR
+
+        :param img_array: RGB图像数组
+        :param latency_budget_ms: 本次请求的耗时预算（毫秒），None表示不限制
+        :param upright: 是否确定为正向文字（如屏幕内容），为True时跳过文字方向分类
+        :return: PaddleOCR的predict结果
+        """
+        tier = self.select(img_array, latency_budget_ms)
+        engine = self.get_engine(tier)
+        start = time.perf_counter()
+        result = engine.predict(img_array, use_textline_orientation=not upright)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        height, width = img_array.shape[:2]
+        self.record(tier, elapsed_ms, height * width)
+        return result
+
+    def record_batch(self, tier, elapsed_ms, image_count):
+        metrics = self.metrics[tier]
+        metrics['batch_calls'] += 1
+        metrics['batch_images'] += image_count
+        metrics['batch_ms'] += elapsed_ms
+        logger.debug(f"批量OCR[{tier}]耗时{elapsed_ms:.0f}ms，累计{metrics['batch_calls']}批/{metrics['batch_images']}张")
+
+    def group_by_size(self, img_arrays):
+        """按面积排序后把尺寸相近的图像分为一组，返回索引分组"""
+        order = sorted(range(len(img_arrays)), key=lambda i: img_arrays[i].shape[0] * img_arrays[i].shape[1])
+        groups = []
+        for i in order:
+            height, width = img_arrays[i].shape[:2]
+            if groups:
+                base_height, base_width = img_arrays[groups[-1][0]].shape[:2]
+                if height <= base_height * self.BATCH_SIZE_TOLERANCE and width <= base_width * self.BATCH_SIZE_TOLERANCE:
+                    groups[-1].append(i)
+                    continue
+            groups.append([i])
+        return groups
+
+    def pad_batch(self, img_arrays):
+        """
+        将尺寸相近的图像在右侧和底部用白色填充到相同尺寸，使同组图像的检测输入尺寸一致；
+        填充不改变原有像素坐标，识别结果无需换算
+
+        :return: (填充后的图像列表, 对应的原始索引列表)，同组图像相邻
+        """
+        padded = []
+        indices = []
+        for group in self.group_by_size(img_arrays):
+            max_height = max(img_arrays[i].shape[0] for i in group)
+            max_width = max(img_arrays[i].shape[1] for i in group)
+            for i in group:
+                img_array = img_arrays[i]
+                height, width = img_array.shape[:2]
+                if (height, width) != (max_height, max_width):
+                    canvas = np.full((max_height, max_width, 3), 255, dtype=np.uint8)
+                    canvas[:height, :width] = img_array
+                    img_array = canvas
+                padded.append(img_array)
+                indices.append(i)
+        return padded, indices
+
+    def predict_batch(self, img_arrays, upright=False):
+        """
+        用一次predict调用识别多张图像
+
+        :param img_arrays: RGB图像数组列表
+        :param upright: 是否确定均为正向文字，为True时跳过文字方向分类
+        :return: 与输入顺序一致的predict结果列表
+        """
+        if not img_arrays:
+            return []
+        # 任意一张需要server模型时整批使用server模型
+        tiers = {self.select(img_array) for img_array in img_arrays}
+        tier = 'server' if 'server' in tiers else 'mobile'
+        padded, indices = self.pad_batch(img_arrays)
+        engine = self.get_engine(tier)
+        start = time.perf_counter()
+        batch_result = list(engine.predict(padded, use_textline_orientation=not upright))
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.record_batch(tier, elapsed_ms, len(img_arrays))
+        logger.info(f"批量OCR[{tier}]完成，{len(img_arrays)}张图像，耗时{elapsed_ms:.0f}ms")
+
+        results = [None] * len(img_arrays)
+        for i, result in zip(indices, batch_result):
+            results[i] = result
+        return results
+
 class ScreenshotOCR(QtCore.QObject):
+    # 各交互入口的OCR耗时预算（毫秒），超出时改用mobile模型
+    # 按server模型约800ms/百万像素估算：截图覆盖4K整屏，贴图覆盖常见照片，区域覆盖中等大小的段落
+    SCREENSHOT_LATENCY_BUDGET_MS = 10000
+    PINNED_LATENCY_BUDGET_MS = 30000
+    REGION_LATENCY_BUDGET_MS = 2000
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        logger.debug("初始化PaddleOCR")
+        logger.debug("初始化OCR引擎选择器")
         logging.getLogger('PIL').setLevel(logging.CRITICAL)
         logging.getLogger('ppocr').setLevel(logging.CRITICAL)
         logging.getLogger('paddle').setLevel(logging.CRITICAL)
         logging.getLogger('paddlex').setLevel(logging.CRITICAL)
-        self.ocr = PaddleOCR(use_textline_orientation=True, lang='ch', ocr_version='PP-OCRv5')
-        logger.info("PaddleOCR初始化完成")
+        # 模型在首次识别时按需加载
+        self.ocr_engine = OcrEngineSelector()
+        logger.info("OCR引擎选择器初始化完成")
 
     def screenshot_and_ocr(self):
         logger.info("收到OCR快捷键")
@@ -476,69 +1240,90 @@ class ScreenshotOCR(QtCore.QObject):
             img = ImageGrab.grab(bbox=rect)
             logger.debug(f"截图完成，图像大小: {img.size}")
 
-            # 复用图像OCR处理逻辑
-            self.process_ocr(img)
+            # 确保图像是RGB模式
+            if img.mode != "RGB":
+                img = img.convert("RGB")
+
+            # 屏幕内容总是正向的，跳过文字方向分类
+            self.process_ocr(np.array(img), upright=True, latency_budget_ms=self.SCREENSHOT_LATENCY_BUDGET_MS)
         except Exception as e:
             logger.error(f"OCR流程异常: {e}")
             import traceback
             logger.error(f"详细错误信息: {traceback.format_exc()}")
             QtWidgets.QMessageBox.critical(None, "错误", str(e))
 
-    def image_ocr(self, img):
-        """处理传入的PIL图像进行OCR识别"""
+    def image_ocr(self, img_array, upright=False, latency_budget_ms=None):
+        """处理传入的RGB图像数组进行OCR识别，返回(texts, polys)，失败时返回None"""
         try:
             logger.info("开始图像OCR流程")
-            logger.debug(f"图像大小: {img.size}")
+            logger.debug(f"图像大小: {img_array.shape[1]}x{img_array.shape[0]}")
             
             # 复用图像OCR处理逻辑
-            self.process_ocr(img)
+            return self.process_ocr(img_array, upright=upright, latency_budget_ms=latency_budget_ms)
         except Exception as e:
             logger.error(f"图像OCR流程异常: {e}")
             import traceback
             logger.error(f"详细错误信息: {traceback.format_exc()}")
             QtWidgets.QMessageBox.critical(None, "错误", str(e))
+            return None
 
-    def process_ocr(self, img):
-        """核心OCR处理逻辑"""
-        # 将PIL.Image对象转换为numpy数组
-        result = self.ocr.predict(np.array(img))
-        
-        # 解析OCR结果
-        text_lines = []
-        draw = ImageDraw.Draw(img)  # 创建绘图对象
+    def process_ocr(self, img_array, upright=False, latency_budget_ms=None):
+        """核心OCR处理逻辑，返回(texts, polys)供调用方缓存"""
+        texts, polys = self.recognize(img_array, upright=upright, latency_budget_ms=latency_budget_ms)
+        self.show_result(img_array, texts, polys)
+        return texts, polys
 
-        if len(result) > 0:
-            # 收集所有文本和坐标信息
-            texts = []
-            polys = []
-            
-            for line in result:
-                if line:
-                    for i, text_line in enumerate(line['rec_texts']):
-                        texts.append(text_line)
-                        polys.append(line['rec_polys'][i])
-            
+    def recognize(self, img_array, upright=False, latency_budget_ms=None):
+        """执行OCR，返回文本列表和对应的坐标列表"""
+        result = self.ocr_engine.predict(img_array, latency_budget_ms=latency_budget_ms, upright=upright)
+        return self.parse_result(result)
+
+    def batch_ocr(self, img_arrays, upright=False):
+        """批量识别多张图像，返回与输入顺序一致的(texts, polys)列表"""
+        logger.info(f"开始批量OCR流程，共{len(img_arrays)}张图像")
+        results = self.ocr_engine.predict_batch(img_arrays, upright=upright)
+        return [self.parse_result([result]) for result in results]
+
+    def parse_result(self, result):
+        """收集PaddleOCR结果中的所有文本和坐标信息"""
+        texts = []
+        polys = []
+        for line in result:
+            if line:
+                for i, text_line in enumerate(line['rec_texts']):
+                    texts.append(text_line)
+                    polys.append(line['rec_polys'][i])
+        return texts, polys
+
+    def render_result(self, img_array, texts, polys):
+        """根据坐标排版文本，并在图片副本上绘制边界框，返回(QImage, text)"""
+        # fromarray会复制像素，绘制边界框不影响原数组
+        img = Image.fromarray(img_array)
+
+        text_lines = []
+        if texts:
             # 根据坐标进行排版
             formatted_text = self.format_text_by_position(texts, polys)
             text_lines = formatted_text.split('\n')
-            
+
             # 在图片上绘制边界框
+            draw = ImageDraw.Draw(img)  # 创建绘图对象
             for poly in polys:
                 points = [(int(point[0]), int(point[1])) for point in poly]
                 draw.polygon(points, outline="red")  # 绘制红色边界框
 
         text = "\n".join(text_lines) if text_lines else "未识别到文字"
-        
-        # 确保图像是RGB模式
-        if img.mode != "RGB":
-            img = img.convert("RGB")
 
         # 将PIL.Image对象转换为 QImage
-        img_array = np.array(img)
-        height, width = img_array.shape[:2]
+        drawn_array = np.array(img)
+        height, width = drawn_array.shape[:2]
         bytes_per_line = 3 * width
-        qimage = QtGui.QImage(img_array.data, width, height, bytes_per_line, QtGui.QImage.Format_RGB888)
+        qimage = QtGui.QImage(drawn_array.data, width, height, bytes_per_line, QtGui.QImage.Format_RGB888).copy()
+        return qimage, text
 
+    def show_result(self, img_array, texts, polys):
+        """显示OCR结果窗口"""
+        qimage, text = self.render_result(img_array, texts, polys)
         dlg = OcrScreenshotDialog(qimage, text)
         dlg.exec_()
 